@@ -1,13 +1,152 @@
-from dataclasses import dataclass
+import csv
+import multiprocessing
+import os
+import re
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, NamedTuple
 from urllib.parse import urljoin
 
+import orjson
+import requests
+from lxml import html as lxml_html
+from lxml.cssselect import CSSSelector
+from lxml.html import HtmlElement
+from selenium import webdriver
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote import utils as remote_utils
+from selenium.webdriver.remote.webdriver import WebDriver
+
+if TYPE_CHECKING:
+    from playwright.sync_api import Page, Route
+
 
 BASE_URL = "https://webscraper.io/"
 HOME_URL = urljoin(BASE_URL, "test-sites/e-commerce/more/")
+COMPUTERS_URL = urljoin(HOME_URL, "computers/")
+LAPTOPS_URL = urljoin(COMPUTERS_URL, "laptops")
+TABLETS_URL = urljoin(COMPUTERS_URL, "tablets")
+PHONES_URL = urljoin(HOME_URL, "phones/")
+TOUCH_URL = urljoin(PHONES_URL, "touch")
+
+STATIC_CATEGORIES = [
+    ("home", HOME_URL, "home.csv"),
+    ("computers", COMPUTERS_URL, "computers.csv"),
+    ("phones", PHONES_URL, "phones.csv"),
+]
+PAGINATED_CATEGORIES = [
+    ("laptops", LAPTOPS_URL, "laptops.csv"),
+    ("tablets", TABLETS_URL, "tablets.csv"),
+    ("touch", TOUCH_URL, "touch.csv"),
+]
+
+ACCEPT_COOKIES_CLASS = "acceptCookies"
+LOAD_MORE_CLASS = "ecomerce-items-scroll-more"
+PRODUCT_WRAPPER_CLASS = "product-wrapper"
+PRODUCT_TITLE_CLASS = "title"
+PRODUCT_DESCRIPTION_CLASS = "description"
+PRODUCT_PRICE_CLASS = "price"
+PRODUCT_RATING_CLASS = "ws-icon-star"
+PRODUCT_REVIEWS_CLASS = "review-count"
+
+ACCEPT_COOKIES_LOCATOR = (By.CSS_SELECTOR, f".{ACCEPT_COOKIES_CLASS}")
+
+PRODUCT_WRAPPER_SELECTOR = CSSSelector(f".{PRODUCT_WRAPPER_CLASS}")
+TITLE_SELECTOR = CSSSelector(f".{PRODUCT_TITLE_CLASS}")
+DESCRIPTION_SELECTOR = CSSSelector(f".{PRODUCT_DESCRIPTION_CLASS}")
+PRICE_SELECTOR = CSSSelector(f".{PRODUCT_PRICE_CLASS}")
+RATING_SELECTOR = CSSSelector(f".{PRODUCT_RATING_CLASS}")
+REVIEWS_SELECTOR = CSSSelector(f".{PRODUCT_REVIEWS_CLASS}")
+REVIEWS_COUNT_REGEX = re.compile(r"\s*(\d+)")
+
+PAGINATION_TIMEOUT = 60
+LOAD_MORE_TIMEOUT = 10
+
+LOAD_ALL_PRODUCTS_FUNCTION = f"""() => {{
+    const findButton = () => document.querySelector(".{LOAD_MORE_CLASS}");
+    const isHidden = button => (
+        !button.isConnected || getComputedStyle(button).display === "none"
+    );
+    const products = document.getElementsByClassName(
+        "{PRODUCT_WRAPPER_CLASS}"
+    );
+    return new Promise((resolve, reject) => {{
+        const waitForMoreProducts = (button, count, deadline) => {{
+            if (products.length > count || isHidden(button)) {{
+                return loop();
+            }}
+            if (Date.now() > deadline) {{
+                return reject(new Error(
+                    "No new products appeared within {LOAD_MORE_TIMEOUT}s "
+                    + "after clicking 'load more'"
+                ));
+            }}
+            setTimeout(() => waitForMoreProducts(button, count, deadline), 10);
+        }};
+        const loop = () => {{
+            const button = findButton();
+            if (!button || isHidden(button)) {{
+                return resolve();
+            }}
+            const count = products.length;
+            button.click();
+            waitForMoreProducts(
+                button, count, Date.now() + {LOAD_MORE_TIMEOUT * 1000}
+            );
+        }};
+        loop();
+    }});
+}}"""
+LOAD_ALL_PRODUCTS_SCRIPT = f"return ({LOAD_ALL_PRODUCTS_FUNCTION})();"
+
+EXTRACT_PRODUCTS_FUNCTION = f"""products => products.map(p => [
+    p.querySelector(".{PRODUCT_TITLE_CLASS}").getAttribute("title"),
+    p.querySelector(".{PRODUCT_DESCRIPTION_CLASS}").textContent.trim(),
+    parseFloat(
+        p.querySelector(".{PRODUCT_PRICE_CLASS}").textContent.trim().slice(1)
+    ),
+    p.querySelectorAll(".{PRODUCT_RATING_CLASS}").length,
+    parseInt(p.querySelector(".{PRODUCT_REVIEWS_CLASS}").textContent, 10),
+])"""
+EXTRACT_PRODUCTS_SCRIPT = (
+    f"return ({EXTRACT_PRODUCTS_FUNCTION})"
+    f"([...document.querySelectorAll('.{PRODUCT_WRAPPER_CLASS}')]);"
+)
+
+SCRAPER_BACKEND = os.getenv("SCRAPER_BACKEND", "selenium")
+BLOCKED_RESOURCE_URL_REGEX = re.compile(
+    r"\.(css|woff2?|ttf|otf|eot|png|jpe?g|gif|svg|webp)(\?.*)?$"
+)
+
+CSV_BUFFER_SIZE = 1 << 17
 
+BLOCKED_URL_PATTERNS = [
+    "*.css",
+    "*.css?*",
+    "*.woff",
+    "*.woff?*",
+    "*.woff2",
+    "*.woff2?*",
+    "*.ttf",
+    "*.ttf?*",
+    "*.otf",
+    "*.eot",
+]
 
-@dataclass
-class Product:
+CHROME_DEBUGGER_ADDRESS = os.getenv("CHROME_DEBUGGER_ADDRESS")
+
+options = webdriver.ChromeOptions()
+options.add_argument("--headless")
+options.add_argument("--disable-gpu")
+options.add_argument("--no-sandbox")
+options.add_experimental_option(
+    "prefs",
+    {"profile.managed_default_content_settings.images": 2},
+)
+options.page_load_strategy = "eager"
+
+
+class Product(NamedTuple):
     title: str
     description: str
     price: float
@@ -15,8 +154,252 @@ class Product:
     num_of_reviews: int
 
 
+PRODUCT_FIELDS = Product._fields
+ProductRow = tuple[str, str, float, int, int]
+
+
+class AbstractParser(ABC):
+    @abstractmethod
+    def parse_page(self, url: str, file_name: str) -> int:
+        pass
+
+    @staticmethod
+    def create_csv_file(
+        file_name: str, rows: Iterable[ProductRow]
+    ) -> None:
+        with open(
+            file_name, "w", newline="", buffering=CSV_BUFFER_SIZE
+        ) as file:
+            writer = csv.writer(file)
+            writer.writerow(PRODUCT_FIELDS)
+            writer.writerows(rows)
+
+    @staticmethod
+    def to_product_rows(rows: list[list[Any]]) -> Iterator[ProductRow]:
+        return (
+            (title, description, float(price), rating, num_of_reviews)
+            for title, description, price, rating, num_of_reviews in rows
+        )
+
+
+class StaticProductParser(AbstractParser):
+    def __init__(self, session: requests.Session) -> None:
+        self.session = session
+
+    @staticmethod
+    def get_title(item: HtmlElement) -> str:
+        return TITLE_SELECTOR(item)[0].get("title")
+
+    @staticmethod
+    def get_description(item: HtmlElement) -> str:
+        return DESCRIPTION_SELECTOR(item)[0].text_content().strip()
+
+    @staticmethod
+    def get_price(item: HtmlElement) -> float:
+        return float(PRICE_SELECTOR(item)[0].text_content().strip()[1:])
+
+    @staticmethod
+    def get_rating(item: HtmlElement) -> int:
+        return len(RATING_SELECTOR(item))
+
+    @staticmethod
+    def get_num_of_reviews(item: HtmlElement) -> int:
+        reviews = REVIEWS_SELECTOR(item)[0].text_content()
+        match = REVIEWS_COUNT_REGEX.match(reviews)
+
+        if match is None:
+            raise ValueError(f"Cannot parse review count from {reviews!r}")
+
+        return int(match.group(1))
+
+    def parse_items(
+        self, items: list[HtmlElement]
+    ) -> Iterator[ProductRow]:
+        get_title = self.get_title
+        get_description = self.get_description
+        get_price = self.get_price
+        get_rating = self.get_rating
+        get_num_of_reviews = self.get_num_of_reviews
+
+        for item in items:
+            yield (
+                get_title(item),
+                get_description(item),
+                get_price(item),
+                get_rating(item),
+                get_num_of_reviews(item),
+            )
+
+    def parse_page(self, url: str, file_name: str) -> int:
+        response = self.session.get(url, timeout=10)
+        response.raise_for_status()
+
+        document = lxml_html.fromstring(response.text)
+        items = PRODUCT_WRAPPER_SELECTOR(document)
+
+        self.create_csv_file(file_name, self.parse_items(items))
+
+        return len(items)
+
+
+class ElectronicProductParser(AbstractParser):
+    def __init__(self, driver: WebDriver) -> None:
+        self.driver = driver
+        self.driver.set_script_timeout(PAGINATION_TIMEOUT)
+        self.cookies_accepted = False
+
+    def check_accept_cookies(self) -> None:
+        if self.cookies_accepted:
+            return
+
+        try:
+            self.driver.find_element(*ACCEPT_COOKIES_LOCATOR).click()
+        except NoSuchElementException:
+            pass
+
+        self.cookies_accepted = True
+
+    def handle_pagination(self) -> None:
+        self.driver.execute_script(LOAD_ALL_PRODUCTS_SCRIPT)
+
+    def parse_page(self, url: str, file_name: str) -> int:
+        self.driver.get(url)
+        self.check_accept_cookies()
+        self.handle_pagination()
+
+        rows = self.driver.execute_script(EXTRACT_PRODUCTS_SCRIPT)
+
+        self.create_csv_file(file_name, self.to_product_rows(rows))
+
+        return len(rows)
+
+
+class PlaywrightProductParser(AbstractParser):
+    def __init__(self, page: "Page") -> None:
+        self.page = page
+        self.page.set_default_timeout(PAGINATION_TIMEOUT * 1000)
+        self.page.route(BLOCKED_RESOURCE_URL_REGEX, self.block_resource)
+        self.cookies_accepted = False
+
+    @staticmethod
+    def block_resource(route: "Route") -> None:
+        route.abort()
+
+    def check_accept_cookies(self) -> None:
+        if self.cookies_accepted:
+            return
+
+        accept_cookies = self.page.locator(f".{ACCEPT_COOKIES_CLASS}")
+
+        if accept_cookies.count():
+            accept_cookies.first.click()
+
+        self.cookies_accepted = True
+
+    def handle_pagination(self) -> None:
+        self.page.evaluate(LOAD_ALL_PRODUCTS_FUNCTION)
+
+    def parse_page(self, url: str, file_name: str) -> int:
+        self.page.goto(url, wait_until="domcontentloaded")
+        self.check_accept_cookies()
+        self.handle_pagination()
+
+        rows = self.page.locator(f".{PRODUCT_WRAPPER_CLASS}").evaluate_all(
+            EXTRACT_PRODUCTS_FUNCTION
+        )
+
+        self.create_csv_file(file_name, self.to_product_rows(rows))
+
+        return len(rows)
+
+
+def attach_to_running_chrome(debugger_address: str) -> webdriver.Chrome:
+    attach_options = webdriver.ChromeOptions()
+    attach_options.add_experimental_option("debuggerAddress", debugger_address)
+    attach_options.page_load_strategy = options.page_load_strategy
+
+    driver = webdriver.Chrome(options=attach_options)
+    driver.switch_to.new_window("tab")
+
+    return driver
+
+
+def block_stylesheets_and_fonts(driver: webdriver.Chrome) -> None:
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd(
+        "Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS}
+    )
+
+
+def use_orjson_decoder() -> None:
+    setattr(remote_utils, "load_json", orjson.loads)
+
+
+def scrape_with_selenium(url: str, file_name: str) -> int:
+    use_orjson_decoder()
+
+    if not CHROME_DEBUGGER_ADDRESS:
+        with webdriver.Chrome(options=options) as driver:
+            block_stylesheets_and_fonts(driver)
+            return ElectronicProductParser(driver).parse_page(url, file_name)
+
+    driver = attach_to_running_chrome(CHROME_DEBUGGER_ADDRESS)
+
+    try:
+        block_stylesheets_and_fonts(driver)
+        return ElectronicProductParser(driver).parse_page(url, file_name)
+    finally:
+        try:
+            driver.close()
+        finally:
+            driver.quit()
+
+
+def scrape_with_playwright(url: str, file_name: str) -> int:
+    from playwright.sync_api import sync_playwright
+
+    with sync_playwright() as playwright:
+        browser = playwright.chromium.launch(headless=True)
+
+        try:
+            page = browser.new_page()
+            return PlaywrightProductParser(page).parse_page(url, file_name)
+        finally:
+            browser.close()
+
+
+SCRAPERS = {
+    "selenium": scrape_with_selenium,
+    "playwright": scrape_with_playwright,
+}
+
+
+def scrape_one(url: str, file_name: str) -> int:
+    return SCRAPERS[SCRAPER_BACKEND](url, file_name)
+
+
 def get_all_products() -> None:
-    pass
+    if SCRAPER_BACKEND not in SCRAPERS:
+        raise ValueError(
+            f"Unknown SCRAPER_BACKEND {SCRAPER_BACKEND!r}, "
+            f"expected one of: {', '.join(SCRAPERS)}"
+        )
+
+    context = multiprocessing.get_context("spawn")
+
+    with context.Pool(processes=len(PAGINATED_CATEGORIES)) as pool:
+        paginated = pool.starmap_async(
+            scrape_one,
+            [(url, file_name) for _, url, file_name in PAGINATED_CATEGORIES],
+        )
+
+        with requests.Session() as session:
+            static_parser = StaticProductParser(session)
+
+            for _, url, file_name in STATIC_CATEGORIES:
+                static_parser.parse_page(url, file_name)
+
+        paginated.get()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,110 @@
+import csv
+
+import pytest
+import requests
+from lxml import html as lxml_html
+
+from app.parse import (
+    PRODUCT_FIELDS,
+    PRODUCT_WRAPPER_SELECTOR,
+    AbstractParser,
+    StaticProductParser,
+)
+
+
+PRODUCTS_HTML = """
+<div class="row">
+    <div class="product-wrapper card-body">
+        <div class="caption">
+            <h4 class="price float-end">$295.99</h4>
+            <h4>
+                <a href="/product/1" class="title"
+                   title="Asus VivoBook X441NA-GA190">Asus VivoBook...</a>
+            </h4>
+            <p class="description card-text">
+                Asus VivoBook X441NA-GA190 Chocolate Black, 14"
+            </p>
+        </div>
+        <div class="ratings">
+            <p class="review-count float-end">14 reviews</p>
+            <p data-rating="3">
+                <span class="ws-icon ws-icon-star"></span>
+                <span class="ws-icon ws-icon-star"></span>
+                <span class="ws-icon ws-icon-star"></span>
+            </p>
+        </div>
+    </div>
+    <div class="product-wrapper card-body">
+        <div class="caption">
+            <h4 class="price float-end">$24.99</h4>
+            <h4><a href="/product/2" class="title" title="Nokia 123">N</a></h4>
+            <p class="description card-text">7 day battery</p>
+        </div>
+        <div class="ratings">
+            <p class="review-count float-end">1 reviews</p>
+            <p data-rating="1"><span class="ws-icon ws-icon-star"></span></p>
+        </div>
+    </div>
+</div>
+"""
+
+
+@pytest.fixture
+def static_parser():
+    with requests.Session() as session:
+        yield StaticProductParser(session)
+
+
+def test_parse_items_extracts_all_fields(static_parser):
+    items = PRODUCT_WRAPPER_SELECTOR(lxml_html.fromstring(PRODUCTS_HTML))
+
+    assert list(static_parser.parse_items(items)) == [
+        (
+            "Asus VivoBook X441NA-GA190",
+            'Asus VivoBook X441NA-GA190 Chocolate Black, 14"',
+            295.99,
+            3,
+            14,
+        ),
+        ("Nokia 123", "7 day battery", 24.99, 1, 1),
+    ]
+
+
+def test_to_product_rows_converts_whole_prices_to_float():
+    rows = list(AbstractParser.to_product_rows([["LG", "3.2", 299, 5, 7]]))
+
+    assert rows == [("LG", "3.2", 299.0, 5, 7)]
+    assert isinstance(rows[0][2], float)
+
+
+def test_create_csv_file_writes_header_and_rows(tmp_path):
+    file_name = tmp_path / "products.csv"
+
+    AbstractParser.create_csv_file(
+        str(file_name),
+        AbstractParser.to_product_rows(
+            [["LG Optimus", '3.2" screen', 57.99, 5, 7]]
+        ),
+    )
+
+    with open(file_name, newline="") as file:
+        assert list(csv.reader(file)) == [
+            list(PRODUCT_FIELDS),
+            ["LG Optimus", '3.2" screen', "57.99", "5", "7"],
+        ]
+
+
+@pytest.mark.parametrize(
+    "reviews, expected", [("14 reviews", 14), ("\n  3 reviews", 3)]
+)
+def test_get_num_of_reviews_reads_leading_number(reviews, expected):
+    item = lxml_html.fromstring(f'<p class="review-count">{reviews}</p>')
+
+    assert StaticProductParser.get_num_of_reviews(item) == expected
+
+
+def test_get_num_of_reviews_rejects_non_numeric_text():
+    item = lxml_html.fromstring('<p class="review-count">No reviews</p>')
+
+    with pytest.raises(ValueError, match="No reviews"):
+        StaticProductParser.get_num_of_reviews(item)